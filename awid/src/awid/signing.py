@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 import enum
+import functools
 import json
 
 from nacl.exceptions import BadSignatureError
@@ -31,6 +32,14 @@ SIGNED_FIELDS = frozenset(
         "wait_seconds",
     }
 )
+# Iterating the fixed whitelist lets canonical_payload skip scanning arbitrary
+# input keys. The encoder keeps sort_keys=True regardless: canonical_json_bytes
+# also serves other callers, and nested values must stay canonical too.
+_SORTED_SIGNED_FIELDS = tuple(sorted(SIGNED_FIELDS))
+
+_CANONICAL_ENCODER = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False
+)
 
 
 class VerifyResult(enum.Enum):
@@ -41,13 +50,11 @@ class VerifyResult(enum.Enum):
 
 
 def canonical_json_bytes(fields: dict) -> bytes:
-    return json.dumps(fields, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode(
-        "utf-8"
-    )
+    return _CANONICAL_ENCODER.encode(fields).encode("utf-8")
 
 
 def canonical_payload(fields: dict) -> bytes:
-    filtered = {k: v for k, v in fields.items() if k in SIGNED_FIELDS}
+    filtered = {k: fields[k] for k in _SORTED_SIGNED_FIELDS if k in fields}
     return canonical_json_bytes(filtered)
 
 
@@ -62,19 +69,20 @@ def _decode_signature(signature_b64: str) -> bytes:
     return base64.urlsafe_b64decode(padded)
 
 
-def verify_signature_with_public_key(
-    public_key: bytes, payload: bytes, signature_b64: str | None
-) -> VerifyResult:
-    if not signature_b64:
-        return VerifyResult.UNVERIFIED
+@functools.lru_cache(maxsize=4096)
+def _verify_key_from_did(did: str) -> VerifyKey:
+    # Decoding a did:key (base58 plus multicodec header) and loading the point
+    # repeats for every message from the same sender; the mapping is pure.
+    return VerifyKey(public_key_from_did(did))
+
 
+def _verify_with_key(verify_key: VerifyKey, payload: bytes, signature_b64: str) -> VerifyResult:
     try:
         sig_bytes = _decode_signature(signature_b64)
     except Exception:
         return VerifyResult.FAILED
 
     try:
-        verify_key = VerifyKey(public_key)
         verify_key.verify(payload, sig_bytes)
         return VerifyResult.VERIFIED
     except BadSignatureError:
@@ -83,6 +91,20 @@ def verify_signature_with_public_key(
         return VerifyResult.FAILED
 
 
+def verify_signature_with_public_key(
+    public_key: bytes, payload: bytes, signature_b64: str | None
+) -> VerifyResult:
+    if not signature_b64:
+        return VerifyResult.UNVERIFIED
+
+    try:
+        verify_key = VerifyKey(public_key)
+    except Exception:
+        return VerifyResult.FAILED
+
+    return _verify_with_key(verify_key, payload, signature_b64)
+
+
 def verify_signature(did: str | None, payload: bytes, signature_b64: str | None) -> VerifyResult:
     if not did or not signature_b64:
         return VerifyResult.UNVERIFIED
@@ -91,11 +113,11 @@ def verify_signature(did: str | None, payload: bytes, signature_b64: str | None)
         return VerifyResult.UNVERIFIED
 
     try:
-        public_key = public_key_from_did(did)
+        verify_key = _verify_key_from_did(did)
     except Exception:
         return VerifyResult.FAILED
 
-    return verify_signature_with_public_key(public_key, payload, signature_b64)
+    return _verify_with_key(verify_key, payload, signature_b64)
 
 
 def verify_did_key_signature(*, did_key: str, payload: bytes, signature_b64: str) -> None:
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from awid.did import did_from_public_key, generate_keypair
+from awid.signing import VerifyResult, canonical_payload, sign_message, verify_signature
+
+
+def test_repeat_verification_for_the_same_did_still_checks_each_signature() -> None:
+    private_key, public_key = generate_keypair()
+    did = did_from_public_key(public_key)
+    other_private_key, _ = generate_keypair()
+    payload = canonical_payload({"from_did": did, "body": "hello"})
+    signature = sign_message(private_key, payload)
+
+    assert verify_signature(did, payload, signature) == VerifyResult.VERIFIED
+    assert verify_signature(did, payload + b" ", signature) == VerifyResult.FAILED
+    assert verify_signature(did, payload, sign_message(other_private_key, payload)) == VerifyResult.FAILED
+    assert verify_signature(did, payload, signature) == VerifyResult.VERIFIED
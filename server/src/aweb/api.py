@@ -344,5 +344,12 @@ def create_app(
     return app
 
 
-# Module-level app for uvicorn: `uvicorn aweb.api:app`
-app = create_app()
+def __getattr__(name: str):
+    # Module-level app for uvicorn: `uvicorn aweb.api:app`. Built on first
+    # access so importing create_app (tests, library embedding) does not also
+    # construct and wire a standalone app.
+    if name == "app":
+        module_app = create_app()
+        globals()["app"] = module_app
+        return module_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
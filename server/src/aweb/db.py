@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from pathlib import Path
 from typing import Any, Optional
 
@@ -11,17 +12,24 @@ from pgdbm.migrations import AsyncMigrationManager
 from .config import get_settings
 from awid.db_config import build_database_config
 
+logger = logging.getLogger(__name__)
+
+
 class DatabaseInfra:
     """
     Shared pgdbm infrastructure for the aweb server.
 
     Creates a single shared pool and a single database manager
-    for the unified aweb schema.
+    for the unified aweb schema. When a read replica URL is configured in
+    standalone mode, a second pool backs the ``"aweb_ro"`` manager; otherwise
+    ``"aweb_ro"`` aliases the primary manager.
     """
 
     def __init__(self) -> None:
         self._shared_pool: Optional[Any] = None
         self._manager: Optional[AsyncDatabaseManager] = None
+        self._read_pool: Optional[Any] = None
+        self._read_manager: Optional[AsyncDatabaseManager] = None
         self._initialized: bool = False
         self._init_lock: asyncio.Lock = asyncio.Lock()
         self._owns_pool: bool = True
@@ -49,6 +57,23 @@ class DatabaseInfra:
                 )
                 shared_pool = await AsyncDatabaseManager.create_shared_pool(config)
                 self._owns_pool = True
+
+                if settings.database_read_url:
+                    read_config = build_database_config(
+                        connection_string=settings.database_read_url,
+                        uses_transaction_pooler=settings.database_uses_transaction_pooler,
+                        statement_cache_size=settings.database_statement_cache_size,
+                    )
+                    try:
+                        self._read_pool = await AsyncDatabaseManager.create_shared_pool(read_config)
+                    except Exception:
+                        # The replica is an optimization; an unreachable one must not
+                        # take the server down, so reads fall back to the primary.
+                        logger.warning(
+                            "Read replica unavailable; serving reads from the primary",
+                            exc_info=True,
+                        )
+                        self._read_pool = None
             else:
                 # Host application owns lifecycle of the pool.
                 self._owns_pool = False
@@ -59,6 +84,11 @@ class DatabaseInfra:
                 pool=shared_pool,
                 schema="aweb",
             )
+            if self._read_pool is not None:
+                self._read_manager = AsyncDatabaseManager(
+                    pool=self._read_pool,
+                    schema="aweb",
+                )
 
             await self._manager.execute('CREATE SCHEMA IF NOT EXISTS "aweb"')
 
@@ -78,8 +108,12 @@ class DatabaseInfra:
     async def close(self) -> None:
         if self._shared_pool is not None and self._owns_pool:
             await self._shared_pool.close()
+        if self._read_pool is not None:
+            await self._read_pool.close()
 
         self._manager = None
+        self._read_manager = None
+        self._read_pool = None
         self._shared_pool = None
         self._initialized = False
         self._owns_pool = True
@@ -95,6 +129,8 @@ class DatabaseInfra:
                 "DatabaseInfra is not initialized. Call 'await db_infra.initialize()' first."
             )
         assert self._manager is not None
+        if name == "aweb_ro" and self._read_manager is not None:
+            return self._read_manager
         return self._manager
 
 
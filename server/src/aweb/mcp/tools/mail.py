@@ -264,7 +264,8 @@ async def check_inbox(
             "to_alias": r["to_alias"],
             "subject": r["subject"],
             "priority": r["priority"],
-            "read": read_at is not None or r["message_id"] in unread_message_ids,
+            # Every returned row was already read or was just auto-acked above.
+            "read": True,
             "read_at": read_at,
             "created_at": _utc_iso(r["created_at"]),
             "to_did": r.get("to_did"),
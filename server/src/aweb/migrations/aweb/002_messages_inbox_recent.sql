@@ -0,0 +1,7 @@
+-- 002_messages_inbox_recent.sql
+-- Full inbox reads (GET /v1/messages/inbox, MCP check_inbox) filter on
+-- to_did and return the newest messages first, read or not.
+-- idx_messages_inbox only covers unread rows, so those reads had no index
+-- to walk and sorted every message addressed to the identity.
+CREATE INDEX IF NOT EXISTS idx_messages_to_did_recent
+    ON {{tables.messages}} (to_did, created_at DESC);
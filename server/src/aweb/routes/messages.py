@@ -567,7 +567,15 @@ async def get_inbox(
     message_id: str | None = Query(default=None),
     auth: MessagingAuth = Depends(get_messaging_auth),
 ) -> InboxResponse:
-    aweb_db = db.get_manager("aweb")
+    message_id = (message_id or "").strip()
+    # Only full history listings tolerate replica lag. message_id lookups and
+    # unread_only listings follow a just-published mail event or an ack (the
+    # channel client, `aw run` wakes and `aw mail inbox` expect to see their
+    # own writes), so they read from the primary.
+    if message_id or unread_only:
+        aweb_db = db.get_manager("aweb")
+    else:
+        aweb_db = db.get_manager("aweb_ro")
     inbox_dids = auth_dids(auth)
     if not inbox_dids:
         raise HTTPException(status_code=401, detail="Authenticated identity is missing a routing DID")
@@ -575,9 +583,9 @@ async def get_inbox(
     where_clause = "WHERE m.to_did = ANY($1::text[])"
     params: list = [inbox_dids]
 
-    if message_id is not None and message_id.strip():
+    if message_id:
         try:
-            params.append(UUID(message_id.strip()))
+            params.append(UUID(message_id))
         except Exception:
             raise HTTPException(status_code=422, detail="Invalid message_id format")
         where_clause += f" AND m.message_id = ${len(params)}"
@@ -599,7 +607,7 @@ async def get_inbox(
     )
 
     identity_map = await lookup_identity_metadata_by_did(
-        db,
+        aweb_db,
         [
             str(value).strip()
             for row in rows
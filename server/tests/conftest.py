@@ -1,12 +1,19 @@
-"""Minimal pgdbm-backed fixtures for standalone aweb server tests."""
+"""Minimal pgdbm-backed fixtures for standalone aweb server tests.
+
+The aweb database is created and migrated once per session; each test gets
+the same schema with every table truncated, so tests stay isolated without
+paying CREATE DATABASE plus the full migration run per test.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import os
 from pathlib import Path
 
 import pytest_asyncio
 from pgdbm import AsyncDatabaseManager, AsyncMigrationManager
+from pgdbm.testing import AsyncTestDatabase, DatabaseTestConfig
 
 from awid.db_config import build_database_config
 
@@ -17,13 +24,35 @@ os.environ.setdefault("ENVIRONMENT", "testing")
 os.environ.setdefault("AWEB_INTERNAL_AUTH_SECRET", "test-internal-auth-secret")
 
 
-@pytest_asyncio.fixture
-async def shared_test_pool(test_db_factory):
-    db_manager = await test_db_factory.create_db(suffix="aweb_server")
+def pytest_asyncio_loop_factories(config, item):
+    # uvicorn[standard] already pulls in uvloop, which is what production
+    # serves on; the suite is dominated by many tiny awaits that it dispatches
+    # faster than the stdlib selector loop.
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aweb_test_dsn():
+    test_database = AsyncTestDatabase(DatabaseTestConfig.from_env())
+    await test_database.create_test_database(suffix="aweb_server")
+    try:
+        yield test_database.get_test_db_config().get_dsn()
+    finally:
+        await test_database.drop_test_database()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_test_pool(aweb_test_dsn):
     config = build_database_config(
-        connection_string=db_manager.config.get_dsn(),
+        connection_string=aweb_test_dsn,
         min_connections=2,
         max_connections=5,
+        # Throwaway data: don't wait on the WAL flush for every commit.
+        server_settings={"synchronous_commit": "off"},
     )
     pool = await AsyncDatabaseManager.create_shared_pool(config)
     try:
@@ -32,10 +61,8 @@ async def shared_test_pool(test_db_factory):
         await pool.close()
 
 
-@pytest_asyncio.fixture
-async def aweb_cloud_db(shared_test_pool):
-    """Database manager for the unified aweb schema tests."""
-
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _migrated_aweb_db(shared_test_pool):
     temp_manager = AsyncDatabaseManager(pool=shared_test_pool, schema=None)
     await temp_manager.execute("CREATE SCHEMA IF NOT EXISTS aweb")
 
@@ -52,6 +79,26 @@ async def aweb_cloud_db(shared_test_pool):
     )
     await aweb_migrations.apply_pending_migrations()
 
+    tables = await aweb_db.fetch_all(
+        """
+        SELECT tablename FROM pg_tables
+        WHERE schemaname = 'aweb' AND tablename <> 'schema_migrations'
+        ORDER BY tablename
+        """
+    )
+    truncate_sql = "TRUNCATE {} RESTART IDENTITY CASCADE".format(
+        ", ".join(f'aweb."{row["tablename"]}"' for row in tables)
+    )
+    return aweb_db, truncate_sql
+
+
+@pytest_asyncio.fixture
+async def aweb_cloud_db(_migrated_aweb_db):
+    """Database manager for the unified aweb schema tests."""
+
+    aweb_db, truncate_sql = _migrated_aweb_db
+    await aweb_db.execute(truncate_sql)
+
     class DatabaseManagers:
         def __init__(self, aweb_db):
             self.oss_db = aweb_db
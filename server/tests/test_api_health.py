@@ -5,8 +5,6 @@ import logging
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from aweb.api import create_app
-
 
 class _FailingRedis:
     async def ping(self):
@@ -27,6 +25,8 @@ class _DbInfra:
 
 @pytest.mark.asyncio
 async def test_health_hides_internal_exception_details(monkeypatch, caplog):
+    from aweb.api import create_app
+
     async def _noop_mount(_app, _db_infra, _redis, _registry_client):
         return None
 
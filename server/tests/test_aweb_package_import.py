@@ -22,6 +22,16 @@ def test_import_aweb_api_factory_succeeds():
     assert hasattr(module, "create_app")
 
 
+def test_import_aweb_api_builds_module_app_lazily():
+    sys.modules.pop("aweb.api", None)
+
+    module = importlib.import_module("aweb.api")
+
+    assert "app" not in vars(module)
+    assert module.app is module.app
+    assert "app" in vars(module)
+
+
 def test_create_app_installs_mcp_path_normalizer_before_startup():
     from aweb.api import create_app
 
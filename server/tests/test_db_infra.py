@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+from pgdbm import AsyncDatabaseManager
+
+from aweb.config import get_settings
+from aweb.db import DatabaseInfra
+
+
+@pytest.mark.asyncio
+async def test_read_only_manager_aliases_primary_with_host_pool(shared_test_pool):
+    infra = DatabaseInfra()
+    await infra.initialize(shared_pool=shared_test_pool, run_migrations=False)
+    try:
+        assert infra.get_manager("aweb_ro") is infra.get_manager("aweb")
+    finally:
+        await infra.close()
+
+
+@pytest.mark.asyncio
+async def test_standalone_read_url_opens_separate_read_pool(aweb_cloud_db, aweb_test_dsn, monkeypatch):
+    monkeypatch.setenv("AWEB_DATABASE_URL", aweb_test_dsn)
+    monkeypatch.setenv("AWEB_DATABASE_URL_RO", aweb_test_dsn)
+    await aweb_cloud_db.aweb_db.execute(
+        """
+        INSERT INTO {{tables.messages}} (from_did, to_did, from_alias, to_alias, subject, body, priority)
+        VALUES ('did:aw:bob', 'did:aw:alice', 'bob', 'alice', 'hi', 'hello', 'normal')
+        """
+    )
+
+    infra = DatabaseInfra()
+    await infra.initialize(run_migrations=False)
+    read_pool = infra._read_pool
+    try:
+        read_manager = infra.get_manager("aweb_ro")
+        assert read_pool is not None
+        assert read_manager is not infra.get_manager("aweb")
+        assert await read_manager.fetch_value("SELECT count(*) FROM {{tables.messages}}") == 1
+    finally:
+        await infra.close()
+
+    assert read_pool.is_closing()
+    assert infra._read_pool is None
+
+
+@pytest.mark.asyncio
+async def test_unreachable_read_url_falls_back_to_primary(aweb_test_dsn, monkeypatch):
+    replica_url = "postgresql://replica.invalid:5432/aweb"
+    monkeypatch.setenv("AWEB_DATABASE_URL", aweb_test_dsn)
+    monkeypatch.setenv("AWEB_DATABASE_URL_RO", replica_url)
+    create_shared_pool = AsyncDatabaseManager.create_shared_pool
+
+    async def _create_shared_pool(config):
+        if config.connection_string == replica_url:
+            raise ConnectionError("replica unreachable")
+        return await create_shared_pool(config)
+
+    monkeypatch.setattr(AsyncDatabaseManager, "create_shared_pool", _create_shared_pool)
+
+    infra = DatabaseInfra()
+    await infra.initialize(run_migrations=False)
+    try:
+        assert infra.get_manager("aweb_ro") is infra.get_manager("aweb")
+    finally:
+        await infra.close()
+
+
+def test_settings_read_replica_url_is_optional(monkeypatch):
+    monkeypatch.setenv("AWEB_DATABASE_URL", "postgresql://primary/aweb")
+    monkeypatch.delenv("AWEB_DATABASE_URL_RO", raising=False)
+    monkeypatch.delenv("DATABASE_URL_RO", raising=False)
+    assert get_settings().database_read_url is None
+
+    monkeypatch.setenv("DATABASE_URL_RO", "postgresql://replica/aweb")
+    assert get_settings().database_read_url == "postgresql://replica/aweb"
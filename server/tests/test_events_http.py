@@ -610,18 +610,22 @@ async def test_current_actionable_mail_keeps_newest_unread_in_diff_window(aweb_c
         """,
         uuid4(),
     )
-    for i in range(50):
-        await aweb_cloud_db.aweb_db.execute(
-            """
-            INSERT INTO {{tables.messages}}
-                (message_id, from_did, to_did, from_alias, to_alias, subject, body, created_at)
-            VALUES ($1, 'did:aw:alice', 'did:aw:bob', 'alice', 'bob', $2, $3, $4)
-            """,
-            f"00000000-0000-4000-8000-{i + 1:012d}",
-            f"old-{i}",
-            f"old-body-{i}",
-            created_at + timedelta(minutes=i),
-        )
+    await aweb_cloud_db.aweb_db.executemany(
+        """
+        INSERT INTO {{tables.messages}}
+            (message_id, from_did, to_did, from_alias, to_alias, subject, body, created_at)
+        VALUES ($1, 'did:aw:alice', 'did:aw:bob', 'alice', 'bob', $2, $3, $4)
+        """,
+        [
+            (
+                f"00000000-0000-4000-8000-{i + 1:012d}",
+                f"old-{i}",
+                f"old-body-{i}",
+                created_at + timedelta(minutes=i),
+            )
+            for i in range(50)
+        ],
+    )
 
     previous = await events_module._current_actionable_mail(
         aweb_cloud_db.aweb_db,
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 
 import aweb.lifecycle as lifecycle
 from aweb.lifecycle import (
@@ -14,6 +15,24 @@ from aweb.lifecycle import (
 )
 
 
+@pytest_asyncio.fixture
+async def agents_signing_key_column(aweb_cloud_db):
+    """Add the hosted-only agents.signing_key_enc column for one test.
+
+    The aweb schema is shared across the session, so the column is dropped
+    again to keep other tests on the OSS table shape.
+    """
+    await aweb_cloud_db.aweb_db.execute(
+        "ALTER TABLE {{tables.agents}} ADD COLUMN signing_key_enc BYTEA"
+    )
+    try:
+        yield
+    finally:
+        await aweb_cloud_db.aweb_db.execute(
+            "ALTER TABLE {{tables.agents}} DROP COLUMN signing_key_enc"
+        )
+
+
 async def _seed_workspace_with_claim(aweb_db, *, lifetime: str = "ephemeral"):
     team_id = "backend:acme.com"
     agent_id = uuid4()
@@ -175,6 +194,7 @@ async def test_lifecycle_apply_reports_post_commit_event_failures(aweb_cloud_db,
 @pytest.mark.asyncio
 async def test_lifecycle_archive_persistent_agent_cleans_coordination_state(
     aweb_cloud_db,
+    agents_signing_key_column,
     monkeypatch,
 ):
     team_id, agent_id, workspace_id = await _seed_workspace_with_claim(
@@ -183,9 +203,6 @@ async def test_lifecycle_archive_persistent_agent_cleans_coordination_state(
     )
     second_workspace_id = uuid4()
     session_id = uuid4()
-    await aweb_cloud_db.aweb_db.execute(
-        "ALTER TABLE {{tables.agents}} ADD COLUMN signing_key_enc BYTEA"
-    )
     await aweb_cloud_db.aweb_db.execute(
         "UPDATE {{tables.agents}} SET signing_key_enc = $2 WHERE agent_id = $1",
         agent_id,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
@@ -942,21 +943,44 @@ async def test_mcp_chat_send_existing_session_uses_hosted_signer(aweb_cloud_db,
             "signed_payload": signed_payload,
         }
 
-    result = json.loads(
-        await chat_tools.chat_send(
-            DBInfra(aweb_cloud_db.aweb_db),
-            None,
-            registry_client=None,
-            hosted_signer=_signer,
-            session_id=str(session_id),
-            message="existing session",
-            wait=True,
-            wait_seconds=7,
-            hang_on=True,
+    async with asyncio.TaskGroup() as tg:
+        send_task = tg.create_task(
+            chat_tools.chat_send(
+                DBInfra(aweb_cloud_db.aweb_db),
+                None,
+                registry_client=None,
+                hosted_signer=_signer,
+                session_id=str(session_id),
+                message="existing session",
+                wait=True,
+                wait_seconds=7,
+                hang_on=True,
+            )
         )
-    )
+        # Reply as bob as soon as alice's message lands instead of letting
+        # the wait run out its full window.
+        for _ in range(250):
+            if await aweb_cloud_db.aweb_db.fetch_one(
+                "SELECT 1 FROM {{tables.chat_messages}} WHERE from_did = $1",
+                alice_did,
+            ):
+                break
+            await asyncio.sleep(0.02)
+        else:
+            pytest.fail("chat_send never stored alice's message")
+        await aweb_cloud_db.aweb_db.execute(
+            """
+            INSERT INTO {{tables.chat_messages}} (session_id, from_agent_id, from_did, from_alias, body)
+            VALUES ($1, $2, 'did:key:z6MkBob', 'bob', 'ack')
+            """,
+            session_id,
+            bob_agent_id,
+        )
+    result = json.loads(send_task.result())
 
     assert result["delivered"] is True
+    assert result["timed_out"] is False
+    assert [reply["body"] for reply in result["replies"]] == ["ack"]
     assert len(seen) == 1
     assert seen[0]["message_type"] == "chat"
     assert seen[0]["payload"]["from_did"] == alice_did
@@ -964,8 +988,10 @@ async def test_mcp_chat_send_existing_session_uses_hosted_signer(aweb_cloud_db,
     assert seen[0]["payload"]["hang_on"] is True
     assert seen[0]["payload"]["to"] == "bob"
     assert seen[0]["payload"]["to_did"] == "did:key:z6MkBob"
-    row = await aweb_cloud_db.aweb_db.fetch_one("SELECT * FROM {{tables.chat_messages}}")
-    assert row["from_did"] == alice_did
+    row = await aweb_cloud_db.aweb_db.fetch_one(
+        "SELECT * FROM {{tables.chat_messages}} WHERE from_did = $1",
+        alice_did,
+    )
     assert row["signature"]
     assert row["signed_payload"] == canonical_signed_payload(seen[0]["payload"])
 
@@ -322,6 +322,47 @@ async def test_messages_inbox_filters_by_message_id(aweb_cloud_db):
     assert [item["message_id"] for item in body["messages"]] == ["22222222-2222-2222-2222-222222222222"]
 
 
+@pytest.mark.asyncio
+async def test_messages_inbox_lists_from_read_pool_but_looks_up_message_id_on_primary(aweb_cloud_db):
+    alice_sk, _, alice_did_key = _make_keypair()
+    registry = AsyncMock()
+    registry.resolve_key = AsyncMock(return_value=KeyResolution(did_aw="did:aw:alice", current_did_key=alice_did_key))
+    registry.list_did_addresses = AsyncMock(return_value=[])
+    app = _build_test_app(aweb_cloud_db.aweb_db, registry)
+    requested: list[str] = []
+
+    class _RecordingDbShim:
+        def get_manager(self, name="aweb"):
+            requested.append(name)
+            return aweb_cloud_db.aweb_db
+
+    app.state.db = _RecordingDbShim()
+
+    async def _requested_managers(client, path):
+        requested.clear()
+        resp = await client.get(
+            path,
+            headers=_signed_identity_headers(alice_sk, alice_did_key, "did:aw:alice"),
+        )
+        assert resp.status_code == 200, resp.text
+        return requested.copy()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        history_requested = await _requested_managers(client, "/v1/messages/inbox")
+        unread_requested = await _requested_managers(client, "/v1/messages/inbox?unread_only=true")
+        lookup_requested = await _requested_managers(
+            client,
+            "/v1/messages/inbox?unread_only=true&message_id=22222222-2222-2222-2222-222222222222",
+        )
+
+    # Auth resolution reads the primary in every case; only the full history
+    # listing moves to the read pool. Unread listings and message_id lookups
+    # follow fresh events and acks, so they must see the primary's writes.
+    assert history_requested.count("aweb_ro") == 1
+    assert "aweb_ro" not in unread_requested
+    assert "aweb_ro" not in lookup_requested
+
+
 @pytest.mark.asyncio
 async def test_send_message_mutation_context_includes_from_did_aw(aweb_cloud_db):
     alice_sk, _, alice_did_key = _make_keypair()
@@ -7,3 +7,4 @@ def test_defaults_and_migrations_are_packaged():
     assert (package_root / "defaults" / "team_instructions.md").is_file()
     assert (package_root / "defaults" / "roles" / "backend.md").is_file()
     assert (package_root / "migrations" / "aweb" / "001_initial.sql").is_file()
+    assert (package_root / "migrations" / "aweb" / "002_messages_inbox_recent.sql").is_file()
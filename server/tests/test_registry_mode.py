@@ -1,6 +1,5 @@
 import pytest
 
-from aweb.api import create_app
 from aweb.config import DEFAULT_AWID_REGISTRY_URL, get_awid_registry_url
 
 
@@ -41,6 +40,8 @@ def test_registry_url_local_detection_is_rejected_case_insensitively(monkeypatch
 
 
 def test_create_app_never_mounts_awid_registry_routes(monkeypatch):
+    from aweb.api import create_app
+
     monkeypatch.setenv("AWID_REGISTRY_URL", "https://api.awid.ai")
 
     app = create_app()
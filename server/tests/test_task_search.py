@@ -32,20 +32,19 @@ async def _seed_team_and_tasks(aweb_db):
     )
 
     tasks = [
-        (uuid.uuid4(), 1, 1, "aaaa", "Fix login bug"),
-        (uuid.uuid4(), 2, 2, "aabb", "Add search feature"),
-        (uuid.uuid4(), 3, 3, "aacc", "Update documentation"),
+        (uuid.uuid4(), TEAM_ADDRESS, 1, 1, "aaaa", "Fix login bug"),
+        (uuid.uuid4(), TEAM_ADDRESS, 2, 2, "aabb", "Add search feature"),
+        (uuid.uuid4(), TEAM_ADDRESS, 3, 3, "aacc", "Update documentation"),
     ]
-    for task_id, num, seq, suffix, title in tasks:
-        await aweb_db.execute(
-            """
-            INSERT INTO {{tables.tasks}}
-                (task_id, team_id, task_number, root_task_seq, task_ref_suffix, title,
-                 status, priority, task_type)
-            VALUES ($1, $2, $3, $4, $5, $6, 'open', 2, 'task')
-            """,
-            task_id, TEAM_ADDRESS, num, seq, suffix, title,
-        )
+    await aweb_db.executemany(
+        """
+        INSERT INTO {{tables.tasks}}
+            (task_id, team_id, task_number, root_task_seq, task_ref_suffix, title,
+             status, priority, task_type)
+        VALUES ($1, $2, $3, $4, $5, $6, 'open', 2, 'task')
+        """,
+        tasks,
+    )
 
 
 @pytest.mark.asyncio